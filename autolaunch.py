@@ -1,10 +1,17 @@
 """
 Auto-launch script — runs every test inside the regression suite directory.
 
+Tests are distributed across worker processes with pytest-xdist, one
+test class at a time (--dist=loadscope), so each class keeps its
+fixtures on a single worker. The number of workers defaults to one per
+CPU and can be overridden with the PYTEST_WORKERS environment variable
+(e.g. PYTEST_WORKERS=4).
+
 Usage:
     python autolaunch.py
 """
 
+import os
 import subprocess
 import sys
 
@@ -15,6 +22,8 @@ if __name__ == "__main__":
         sys.executable, "-m", "pytest",
         SUITE_DIR,
         "-v",
+        "-n", os.environ.get("PYTEST_WORKERS", "auto"),
+        "--dist=loadscope",
     ]
     print(f"Running: {' '.join(cmd)}\n")
     sys.exit(subprocess.call(cmd))
@@ -16,6 +16,18 @@ class APIConfig:
     # Default timeout for requests (seconds)
     REQUEST_TIMEOUT = 30
 
+    # Connection pool sizing for the shared HTTP session. All requests go
+    # to a single host, so a larger pool keeps connections alive under
+    # parallel runs instead of re-doing TCP/TLS handshakes.
+    POOL_CONNECTIONS = 32
+    POOL_MAXSIZE = 64
+
+    # Concurrent connection limit for the async (httpx) client
+    ASYNC_MAX_CONNECTIONS = 100
+
+    # Retries for failed connections (not for received error responses)
+    MAX_RETRIES = 3
+
     # Auth credentials for the API (public test credentials)
     AUTH_USERNAME = os.getenv("API_USERNAME", "admin")
     AUTH_PASSWORD = os.getenv("API_PASSWORD", "password123")
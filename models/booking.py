@@ -10,7 +10,7 @@ from dataclasses import dataclass, field, asdict
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BookingDates:
     """Check-in and check-out dates for a booking."""
 
@@ -18,9 +18,15 @@ class BookingDates:
     checkout: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Booking:
-    """Representation of a booking payload."""
+    """
+    Representation of a booking payload.
+
+    Frozen so instances shared between tests (e.g. the session-scoped
+    sample booking) cannot be modified. Slotted (no per-instance
+    `__dict__`) for smaller instances and faster attribute access.
+    """
 
     firstname: str
     lastname: str
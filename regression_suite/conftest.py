@@ -2,16 +2,21 @@
 Pytest fixtures for the API test framework.
 
 Provides shared setup/teardown logic:
-- BookingService instance management
-- Pre-created booking for tests that need existing data
+- BookingService / AsyncBookingService instance management
+- Pre-created bookings for tests that need existing data
+  (shared per module for read-only tests, per test for mutating tests)
 - Logging configuration
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import pytest
+import pytest_asyncio
 
 from models.booking import Booking, BookingDates
+from services.async_booking_service import AsyncBookingService
 from services.booking_service import BookingService
 from utils.test_data import create_valid_booking
 
@@ -31,35 +36,108 @@ def booking_service() -> BookingService:
     service.close()
 
 
+@pytest_asyncio.fixture
+async def async_booking_service() -> AsyncBookingService:
+    """
+    Provide an AsyncBookingService for tests that send requests concurrently.
+
+    Function-scoped so the client is bound to the test's event loop.
+    """
+    service = AsyncBookingService()
+    yield service
+    await service.close()
+
+
 @pytest.fixture(scope="session")
 def auth_token(booking_service: BookingService) -> str:
-    """Get an authentication token for the session."""
-    return booking_service.authenticate()
-
+    """
+    Get an authentication token for the session.
 
-@pytest.fixture
-def sample_booking() -> Booking:
-    """Provide a sample valid booking for testing."""
-    return create_valid_booking()
+    Reuses the service's lazily obtained token, so requesting this
+    fixture never costs an extra /auth round-trip.
+    """
+    return booking_service.token
 
 
-@pytest.fixture
-def created_booking(booking_service: BookingService, sample_booking: Booking):
+@pytest.fixture(scope="session")
+def sample_booking() -> Booking:
     """
-    Create a booking and return its ID and data.
+    Provide a sample valid booking for testing.
 
-    Useful for tests that need an existing booking (GET, PUT, DELETE).
+    Session-scoped because tests only read it (via `to_dict()`).
     """
-    response = booking_service.create_booking(sample_booking)
+    return create_valid_booking()
+
+
+def _create_test_booking(booking_service: BookingService, booking: Booking) -> dict:
+    """Create a booking in the API and return its ID and data."""
+    response = booking_service.create_booking(booking)
     data = response.json()
     booking_id = data["bookingid"]
     logger.info(f"Created test booking with ID: {booking_id}")
+    return {"id": booking_id, "data": data["booking"]}
 
-    yield {"id": booking_id, "data": data["booking"]}
 
-    # Cleanup: attempt to delete the booking after test
+def _cleanup_test_booking(booking_service: BookingService, booking_id: int):
+    """Attempt to delete a test booking, logging instead of failing."""
     try:
         booking_service.delete_booking(booking_id)
         logger.info(f"Cleaned up booking ID: {booking_id}")
     except Exception:
         logger.warning(f"Could not clean up booking ID: {booking_id}")
+
+
+@pytest.fixture(scope="session")
+def booking_cleanup_queue(booking_service: BookingService) -> list:
+    """
+    Collect IDs of bookings created by fixtures and delete them at session end.
+
+    The deletes run concurrently on the pooled HTTP session, so teardown
+    takes roughly one round-trip instead of one per booking.
+    """
+    queue: list[int] = []
+    yield queue
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(partial(_cleanup_test_booking, booking_service), queue))
+
+
+@pytest.fixture(scope="module")
+def shared_created_booking(
+    booking_service: BookingService,
+    sample_booking: Booking,
+    booking_cleanup_queue: list,
+):
+    """
+    Create one booking per test module and return its ID and data.
+
+    For read-only tests (GET, filters, type checks) — the booking is
+    shared, so tests using this fixture must not modify it. Under
+    pytest-xdist it is created once per worker that needs it. Deletion
+    is deferred to the end of the session.
+    """
+    booking = _create_test_booking(booking_service, sample_booking)
+    booking_cleanup_queue.append(booking["id"])
+    return booking
+
+
+@pytest.fixture
+def created_booking(
+    booking_service: BookingService,
+    sample_booking: Booking,
+    booking_cleanup_queue: list,
+):
+    """
+    Create a booking and return its ID and data.
+
+    Useful for tests that modify an existing booking (PUT, PATCH).
+    Read-only tests should use `shared_created_booking` instead.
+
+    Function-scoped: every test gets its own booking, so tests that
+    modify it never collide on a single record, even when test classes
+    run on different pytest-xdist workers. Deletion is deferred to the
+    end of the session.
+    """
+    booking = _create_test_booking(booking_service, sample_booking)
+    booking_cleanup_queue.append(booking["id"])
+    return booking
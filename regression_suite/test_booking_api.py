@@ -7,10 +7,10 @@ Tests cover the core CRUD operations for the Booking resource:
 3. Update Booking (PUT)         — validates full update of all fields
 4. Delete Booking (DELETE)      — validates booking deletion
 
-Additional tests use pytest.mark.parametrize for:
-5. Create bookings with various data combinations
-6. Filter bookings by name
-7. Validate response structure and types
+Additional tests:
+5. Create bookings with various data combinations (sent concurrently)
+6. Filter bookings by name (parametrized)
+7. Validate response structure and types (parametrized)
 8. Edge cases with boundary values
 
 Validation Strategy:
@@ -26,16 +26,15 @@ import logging
 import pytest
 
 from models.booking import Booking, BookingDates
+from services.async_booking_service import AsyncBookingService
 from services.booking_service import BookingService
-from utils.test_data import create_valid_booking
+from utils.test_data import create_valid_booking, create_valid_booking_bytes
 from utils.validators import (
-    assert_status_code,
     assert_json_key_exists,
     assert_json_value,
     assert_booking_fields,
-    assert_response_time,
     assert_json_list_not_empty,
-    assert_content_type,
+    validate,
 )
 
 logger = logging.getLogger(__name__)
@@ -62,71 +61,93 @@ class TestCreateBooking:
         """
         response = booking_service.create_booking(sample_booking)
 
-        assert_status_code(response, 200)
-        data = response.json()
-
-        # Verify response structure
-        assert "bookingid" in data, "Response missing 'bookingid'"
-        assert "booking" in data, "Response missing 'booking'"
+        # Verify status and response structure
+        validate(response, status=200, json_schema={"bookingid": int, "booking": dict})
 
         # Verify echoed data matches input
-        assert_booking_fields(data["booking"], sample_booking.to_dict())
-
-    @pytest.mark.parametrize(
-        "firstname, lastname, totalprice, depositpaid, checkin, checkout, additionalneeds",
-        [
-            ("Alice", "Smith", 200, True, "2025-03-01", "2025-03-05", "Lunch"),
-            ("Bob", "Johnson", 0, False, "2025-06-15", "2025-06-20", None),
-            ("Charlie", "Brown", 99999, True, "2025-12-24", "2025-12-31", "Late checkout"),
-            ("Diana", "Prince", 50, True, "2025-01-01", "2025-01-02", "Extra pillow"),
-        ],
-        ids=[
-            "standard_booking",
-            "zero_price_no_deposit",
-            "high_price_holiday",
-            "minimal_stay_with_needs",
-        ],
-    )
-    def test_create_booking_with_various_data(
-        self,
-        booking_service: BookingService,
-        firstname,
-        lastname,
-        totalprice,
-        depositpaid,
-        checkin,
-        checkout,
-        additionalneeds,
+        assert_booking_fields(response.json()["booking"], sample_booking.to_dict())
+
+    # firstname, lastname, totalprice, depositpaid, checkin, checkout, additionalneeds
+    VARIOUS_BOOKING_DATA = {
+        "standard_booking": ("Alice", "Smith", 200, True, "2025-03-01", "2025-03-05", "Lunch"),
+        "zero_price_no_deposit": ("Bob", "Johnson", 0, False, "2025-06-15", "2025-06-20", None),
+        "high_price_holiday": ("Charlie", "Brown", 99999, True, "2025-12-24", "2025-12-31", "Late checkout"),
+        "minimal_stay_with_needs": ("Diana", "Prince", 50, True, "2025-01-01", "2025-01-02", "Extra pillow"),
+    }
+
+    @pytest.mark.asyncio
+    async def test_create_booking_with_various_data(
+        self, async_booking_service: AsyncBookingService
     ):
         """
         TC-02: Create bookings with different data combinations.
 
-        Uses pytest.parametrize to test multiple scenarios with
-        a single test method — keeps code DRY with high coverage.
+        All combinations are submitted concurrently, so the test costs
+        roughly one round-trip instead of one per combination.
 
         Validation:
           - Each combination returns status 200
           - Each booking gets a unique ID
           - Returned data matches input for key fields
         """
-        booking = create_valid_booking(
-            firstname=firstname,
-            lastname=lastname,
-            totalprice=totalprice,
-            depositpaid=depositpaid,
-            bookingdates=BookingDates(checkin=checkin, checkout=checkout),
-            additionalneeds=additionalneeds,
-        )
-        response = booking_service.create_booking(booking)
-
-        assert_status_code(response, 200)
-        data = response.json()
+        bookings = [
+            create_valid_booking(
+                firstname=firstname,
+                lastname=lastname,
+                totalprice=totalprice,
+                depositpaid=depositpaid,
+                bookingdates=BookingDates(checkin=checkin, checkout=checkout),
+                additionalneeds=additionalneeds,
+            )
+            for (
+                firstname, lastname, totalprice, depositpaid,
+                checkin, checkout, additionalneeds,
+            ) in self.VARIOUS_BOOKING_DATA.values()
+        ]
+        responses = await async_booking_service.create_many(bookings)
+
+        booking_ids = set()
+        for case, booking, response in zip(
+            self.VARIOUS_BOOKING_DATA, bookings, responses
+        ):
+            logger.info(f"Checking case: {case}")
+            validate(response, status=200, json_schema={"bookingid": int})
+            data = response.json()
+
+            assert data["booking"]["firstname"] == booking.firstname, case
+            assert data["booking"]["lastname"] == booking.lastname, case
+            assert data["booking"]["totalprice"] == booking.totalprice, case
+            assert data["booking"]["depositpaid"] == booking.depositpaid, case
+            booking_ids.add(data["bookingid"])
+
+        assert len(booking_ids) == len(bookings), "Booking IDs are not unique"
+
+    def test_create_booking_from_raw_payload(
+        self, booking_service: BookingService, booking_cleanup_queue: list
+    ):
+        """
+        TC-13: Create a booking from a pre-serialized JSON payload.
 
-        assert isinstance(data["bookingid"], int), "bookingid should be an integer"
-        assert data["booking"]["firstname"] == firstname
-        assert data["booking"]["lastname"] == lastname
-        assert data["booking"]["totalprice"] == totalprice
-        assert data["booking"]["depositpaid"] == depositpaid
+        Validation:
+          - Status code is 200
+          - Response contains an integer 'bookingid'
+          - Overridden and merged default fields are echoed correctly
+        """
+        body = create_valid_booking_bytes(
+            firstname="Raw", bookingdates={"checkin": "2025-05-01"}
+        )
+        response = booking_service.create_booking_raw(body)
+
+        validate(response, status=200, json_schema={"bookingid": int})
+        booking_cleanup_queue.append(response.json()["bookingid"])
+        assert_booking_fields(
+            response.json()["booking"],
+            {
+                "firstname": "Raw",
+                "lastname": "Doe",
+                "bookingdates": {"checkin": "2025-05-01", "checkout": "2025-01-10"},
+            },
+        )
 
 
 # ════════════════════════════════════════════════════════════════
@@ -138,7 +159,7 @@ class TestGetBooking:
     """Tests for the Get Booking endpoint."""
 
     def test_get_existing_booking(
-        self, booking_service: BookingService, created_booking: dict
+        self, booking_service: BookingService, shared_created_booking: dict
     ):
         """
         TC-03: Retrieve a booking by ID and verify data.
@@ -149,16 +170,19 @@ class TestGetBooking:
           - Content-Type is application/json
           - Response time is under 5 seconds
         """
-        booking_id = created_booking["id"]
+        booking_id = shared_created_booking["id"]
         response = booking_service.get_booking(booking_id)
 
-        assert_status_code(response, 200)
-        assert_content_type(response, "application/json")
-        assert_response_time(response, max_seconds=5.0)
-
-        data = response.json()
-        assert data["firstname"] == created_booking["data"]["firstname"]
-        assert data["lastname"] == created_booking["data"]["lastname"]
+        validate(
+            response,
+            status=200,
+            content_type="application/json",
+            max_time=5.0,
+            json_equals={
+                "firstname": shared_created_booking["data"]["firstname"],
+                "lastname": shared_created_booking["data"]["lastname"],
+            },
+        )
 
     def test_get_nonexistent_booking_returns_404(
         self, booking_service: BookingService
@@ -171,7 +195,7 @@ class TestGetBooking:
           - API correctly handles invalid IDs
         """
         response = booking_service.get_booking(999999999)
-        assert_status_code(response, 404)
+        validate(response, status=404)
 
     def test_get_all_booking_ids(self, booking_service: BookingService):
         """
@@ -184,7 +208,7 @@ class TestGetBooking:
         """
         response = booking_service.get_booking_ids()
 
-        assert_status_code(response, 200)
+        validate(response, status=200)
         assert_json_list_not_empty(response)
 
         data = response.json()
@@ -203,7 +227,7 @@ class TestGetBooking:
     def test_get_bookings_filtered_by_name(
         self,
         booking_service: BookingService,
-        created_booking: dict,
+        shared_created_booking: dict,
         filter_field: str,
         filter_value: str,
     ):
@@ -218,7 +242,7 @@ class TestGetBooking:
         """
         response = booking_service.get_booking_ids(**{filter_field: filter_value})
 
-        assert_status_code(response, 200)
+        validate(response, status=200)
         data = response.json()
         assert isinstance(data, list), f"Expected list, got {type(data).__name__}"
 
@@ -256,12 +280,17 @@ class TestUpdateBooking:
 
         response = booking_service.update_booking(booking_id, updated)
 
-        assert_status_code(response, 200)
-        data = response.json()
-        assert data["firstname"] == "Updated"
-        assert data["lastname"] == "User"
-        assert data["totalprice"] == 999
-        assert data["depositpaid"] is False
+        validate(
+            response,
+            status=200,
+            json_schema={"depositpaid": bool},
+            json_equals={
+                "firstname": "Updated",
+                "lastname": "User",
+                "totalprice": 999,
+                "depositpaid": False,
+            },
+        )
 
     def test_partial_update_booking(
         self, booking_service: BookingService, created_booking: dict
@@ -279,12 +308,16 @@ class TestUpdateBooking:
 
         response = booking_service.partial_update_booking(booking_id, patch_data)
 
-        assert_status_code(response, 200)
-        data = response.json()
-        assert data["firstname"] == "Patched"
-        assert data["totalprice"] == 777
-        # Original lastname should remain
-        assert data["lastname"] == created_booking["data"]["lastname"]
+        validate(
+            response,
+            status=200,
+            json_equals={
+                "firstname": "Patched",
+                "totalprice": 777,
+                # Original lastname should remain
+                "lastname": created_booking["data"]["lastname"],
+            },
+        )
 
 
 # ════════════════════════════════════════════════════════════════
@@ -313,11 +346,11 @@ class TestDeleteBooking:
 
         # Delete it
         delete_response = booking_service.delete_booking(booking_id)
-        assert_status_code(delete_response, 201)
+        validate(delete_response, status=201)
 
         # Verify it's gone
         get_response = booking_service.get_booking(booking_id)
-        assert_status_code(get_response, 404)
+        validate(get_response, status=404)
 
 
 # ════════════════════════════════════════════════════════════════
@@ -348,7 +381,7 @@ class TestResponseValidation:
     def test_booking_response_field_types(
         self,
         booking_service: BookingService,
-        created_booking: dict,
+        shared_created_booking: dict,
         field: str,
         expected_type: type,
     ):
@@ -361,17 +394,10 @@ class TestResponseValidation:
           - Each field exists in the response
           - Each field has the correct Python type
         """
-        booking_id = created_booking["id"]
+        booking_id = shared_created_booking["id"]
         response = booking_service.get_booking(booking_id)
 
-        assert_status_code(response, 200)
-        data = response.json()
-
-        assert field in data, f"Field '{field}' missing from response"
-        assert isinstance(data[field], expected_type), (
-            f"Expected '{field}' to be {expected_type.__name__}, "
-            f"got {type(data[field]).__name__}"
-        )
+        validate(response, status=200, json_schema={field: expected_type})
 
     def test_api_health_check(self, booking_service: BookingService):
         """
@@ -381,10 +407,9 @@ class TestResponseValidation:
           - Ping endpoint returns 201
           - Response time is acceptable
         """
-        response = booking_service.get("/ping")
+        response = booking_service.ping()
 
-        assert_status_code(response, 201)
-        assert_response_time(response, max_seconds=5.0)
+        validate(response, status=201, max_time=5.0)
 
     def test_auth_with_valid_credentials(
         self, booking_service: BookingService
@@ -402,7 +427,5 @@ class TestResponseValidation:
             json={"username": "admin", "password": "password123"},
         )
 
-        assert_status_code(response, 200)
-        data = response.json()
-        assert "token" in data, "Response missing 'token'"
-        assert isinstance(data["token"], str) and len(data["token"]) > 0
+        validate(response, status=200, json_schema={"token": str})
+        assert len(response.json()["token"]) > 0, "Token is empty"
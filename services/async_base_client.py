@@ -0,0 +1,72 @@
+"""
+Async Base API Client - Foundation for concurrent service classes.
+
+Async counterpart of BaseAPIClient, built on `httpx.AsyncClient`:
+- One client (HTTP/2, pooled connections) shared by all requests
+- Common headers
+- Logging of requests/responses
+- Timeout handling
+
+Use it for bulk operations where many independent requests can be
+in flight at once instead of waiting on each round-trip in turn.
+"""
+
+import httpx
+import orjson
+
+from config.settings import APIConfig, Headers
+from services.base_client import RequestLoggingMixin
+
+
+class AsyncBaseClient(RequestLoggingMixin):
+    """
+    Base async HTTP client for API interactions.
+
+    Wraps `httpx.AsyncClient` with the same logging and timeouts
+    as BaseAPIClient, so async services stay consistent with the
+    synchronous ones.
+    """
+
+    def __init__(self, base_url: str = None):
+        self.base_url = base_url or APIConfig.BASE_URL
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=Headers.JSON,
+            timeout=APIConfig.REQUEST_TIMEOUT,
+            http2=True,
+            limits=httpx.Limits(max_connections=APIConfig.ASYNC_MAX_CONNECTIONS),
+        )
+
+    # ── HTTP Methods ────────────────────────────────────────────
+
+    async def get(
+        self,
+        endpoint: str,
+        params: dict = None,
+        headers: dict = None,
+    ) -> httpx.Response:
+        """Send a GET request."""
+        self._log_request("GET", f"{self.base_url}{endpoint}", params=params)
+        response = await self.client.get(endpoint, params=params, headers=headers)
+        self._log_response(response)
+        return response
+
+    async def post(
+        self,
+        endpoint: str,
+        json: dict = None,
+        headers: dict = None,
+    ) -> httpx.Response:
+        """Send a POST request."""
+        self._log_request("POST", f"{self.base_url}{endpoint}", json=json)
+        response = await self.client.post(
+            endpoint,
+            content=None if json is None else orjson.dumps(json),
+            headers=headers,
+        )
+        self._log_response(response)
+        return response
+
+    async def close(self):
+        """Close the client."""
+        await self.client.aclose()
@@ -0,0 +1,50 @@
+"""
+Async Booking Service - Concurrent API client for the Booking endpoints.
+
+Async counterpart of BookingService for bulk operations: many bookings
+can be submitted at once and their round-trips overlap instead of
+running one after another.
+"""
+
+import asyncio
+import logging
+
+import httpx
+
+from models.booking import Booking
+from services.async_base_client import AsyncBaseClient
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBookingService(AsyncBaseClient):
+    """Async service class for the /booking endpoints."""
+
+    ENDPOINT = "/booking"
+
+    async def get_booking(self, booking_id: int) -> httpx.Response:
+        """Get a specific booking by ID."""
+        return await self.get(f"{self.ENDPOINT}/{booking_id}")
+
+    async def create_booking(self, booking: Booking) -> httpx.Response:
+        """
+        Create a new booking.
+
+        Args:
+            booking: Booking data model instance.
+        """
+        return await self.post(self.ENDPOINT, json=booking.to_dict())
+
+    async def create_many(self, bookings: list[Booking]) -> list[httpx.Response]:
+        """
+        Create several bookings concurrently.
+
+        Args:
+            bookings: Booking data model instances.
+
+        Returns:
+            Responses in the same order as `bookings`.
+        """
+        return await asyncio.gather(
+            *(self.create_booking(booking) for booking in bookings)
+        )
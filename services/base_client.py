@@ -14,14 +14,46 @@ All service classes inherit from this base client.
 import logging
 from typing import Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from config.settings import APIConfig, Headers
 
 logger = logging.getLogger(__name__)
 
 
-class BaseAPIClient:
+class RequestLoggingMixin:
+    """
+    Request/response logging shared by the sync and async clients.
+
+    Works with both `requests.Response` and `httpx.Response`, which
+    expose the same `status_code`, `elapsed` and `text` attributes.
+    """
+
+    def _log_request(self, method: str, url: str, **kwargs):
+        """Log outgoing request details."""
+        logger.info("REQUEST  → %s %s", method, url)
+        if logger.isEnabledFor(logging.DEBUG):
+            body = kwargs.get("json")
+            if body is not None:
+                logger.debug("  Body: %r", body)
+            params = kwargs.get("params")
+            if params is not None:
+                logger.debug("  Params: %r", params)
+
+    def _log_response(self, response: requests.Response):
+        """Log incoming response details."""
+        logger.info(
+            "RESPONSE ← %d (%.2fs)",
+            response.status_code,
+            response.elapsed.total_seconds(),
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Body: %s", response.text[:500])
+
+
+class BaseAPIClient(RequestLoggingMixin):
     """
     Base HTTP client for API interactions.
 
@@ -32,28 +64,46 @@ class BaseAPIClient:
     def __init__(self, base_url: str = None):
         self.base_url = base_url or APIConfig.BASE_URL
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=APIConfig.POOL_CONNECTIONS,
+            pool_maxsize=APIConfig.POOL_MAXSIZE,
+            max_retries=APIConfig.MAX_RETRIES,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(Headers.JSON)
+        self.session.headers["Connection"] = "keep-alive"
         self.timeout = APIConfig.REQUEST_TIMEOUT
 
     def _url(self, endpoint: str) -> str:
         """Build the full URL for an endpoint."""
         return f"{self.base_url}{endpoint}"
 
-    def _log_request(self, method: str, url: str, **kwargs):
-        """Log outgoing request details."""
-        logger.info(f"REQUEST  → {method} {url}")
-        if "json" in kwargs:
-            logger.debug(f"  Body: {kwargs['json']}")
-        if "params" in kwargs:
-            logger.debug(f"  Params: {kwargs['params']}")
-
-    def _log_response(self, response: requests.Response):
-        """Log incoming response details."""
-        logger.info(
-            f"RESPONSE ← {response.status_code} "
-            f"({response.elapsed.total_seconds():.2f}s)"
+    def _send_json(
+        self,
+        method: str,
+        endpoint: str,
+        payload: Optional[dict],
+        headers: Optional[dict],
+        body: Optional[bytes] = None,
+    ) -> requests.Response:
+        """
+        Send a request with a JSON body serialized by orjson.
+
+        orjson produces the body as bytes directly, skipping the stdlib
+        `json.dumps` + encode that `requests` does for `json=`. The
+        session already sends `Content-Type: application/json`.
+        Pass `body` instead of `payload` to send pre-serialized bytes.
+        """
+        url = self._url(endpoint)
+        self._log_request(method, url, json=payload if body is None else body)
+        if body is None and payload is not None:
+            body = orjson.dumps(payload)
+        response = self.session.request(
+            method, url, data=body, headers=headers, timeout=self.timeout
         )
-        logger.debug(f"  Body: {response.text[:500]}")
+        self._log_response(response)
+        return response
 
     # ── HTTP Methods ────────────────────────────────────────────
 
@@ -79,13 +129,16 @@ class BaseAPIClient:
         headers: dict = None,
     ) -> requests.Response:
         """Send a POST request."""
-        url = self._url(endpoint)
-        self._log_request("POST", url, json=json)
-        response = self.session.post(
-            url, json=json, headers=headers, timeout=self.timeout
-        )
-        self._log_response(response)
-        return response
+        return self._send_json("POST", endpoint, json, headers)
+
+    def post_raw(
+        self,
+        endpoint: str,
+        body: bytes,
+        headers: dict = None,
+    ) -> requests.Response:
+        """Send a POST request with an already-serialized JSON body."""
+        return self._send_json("POST", endpoint, None, headers, body=body)
 
     def put(
         self,
@@ -94,13 +147,7 @@ class BaseAPIClient:
         headers: dict = None,
     ) -> requests.Response:
         """Send a PUT request."""
-        url = self._url(endpoint)
-        self._log_request("PUT", url, json=json)
-        response = self.session.put(
-            url, json=json, headers=headers, timeout=self.timeout
-        )
-        self._log_response(response)
-        return response
+        return self._send_json("PUT", endpoint, json, headers)
 
     def patch(
         self,
@@ -109,13 +156,7 @@ class BaseAPIClient:
         headers: dict = None,
     ) -> requests.Response:
         """Send a PATCH request."""
-        url = self._url(endpoint)
-        self._log_request("PATCH", url, json=json)
-        response = self.session.patch(
-            url, json=json, headers=headers, timeout=self.timeout
-        )
-        self._log_response(response)
-        return response
+        return self._send_json("PATCH", endpoint, json, headers)
 
     def delete(
         self,
@@ -9,6 +9,7 @@ this service layer instead of making raw HTTP calls, providing:
 """
 
 import logging
+import threading
 from typing import Optional
 
 import requests
@@ -25,10 +26,13 @@ class BookingService(BaseAPIClient):
 
     ENDPOINT = "/booking"
     AUTH_ENDPOINT = "/auth"
+    PING_ENDPOINT = "/ping"
 
     def __init__(self):
         super().__init__()
         self._token: Optional[str] = None
+        self._auth_headers: Optional[dict] = None
+        self._auth_lock = threading.Lock()
 
     # ── Authentication ──────────────────────────────────────────
 
@@ -40,6 +44,11 @@ class BookingService(BaseAPIClient):
         """
         Get an authentication token.
 
+        The Cookie header for the token is built once and reused by
+        every authenticated request. If no token is returned (e.g. bad
+        credentials), nothing is cached and the next authenticated
+        call tries again.
+
         Args:
             username: API username (defaults to config value).
             password: API password (defaults to config value).
@@ -53,15 +62,33 @@ class BookingService(BaseAPIClient):
         }
         response = self.post(self.AUTH_ENDPOINT, json=payload)
         self._token = response.json().get("token")
+        if not self._token:
+            self._auth_headers = None
+            logger.warning("Authentication failed: no token returned")
+            return self._token
+        self._auth_headers = {"Cookie": f"token={self._token}"}
         logger.info("Authentication successful")
         return self._token
 
+    def _ensure_authenticated(self):
+        """Authenticate on first use of an endpoint that needs a token."""
+        if self._auth_headers is None:
+            # Concurrent deletes may get here together; authenticate once
+            with self._auth_lock:
+                if self._auth_headers is None:
+                    self.authenticate()
+
+    @property
+    def token(self) -> str:
+        """Get the authentication token, authenticating on first use."""
+        self._ensure_authenticated()
+        return self._token
+
     @property
     def auth_headers(self) -> dict:
-        """Get headers with authentication cookie."""
-        if not self._token:
-            self.authenticate()
-        return {"Cookie": f"token={self._token}"}
+        """Get headers with authentication cookie (empty if auth failed)."""
+        self._ensure_authenticated()
+        return self._auth_headers or {}
 
     # ── CRUD Operations ─────────────────────────────────────────
 
@@ -81,17 +108,17 @@ class BookingService(BaseAPIClient):
             checkin: Filter by check-in date (YYYY-MM-DD).
             checkout: Filter by check-out date (YYYY-MM-DD).
         """
-        params = {}
-        if firstname:
-            params["firstname"] = firstname
-        if lastname:
-            params["lastname"] = lastname
-        if checkin:
-            params["checkin"] = checkin
-        if checkout:
-            params["checkout"] = checkout
-
-        return self.get(self.ENDPOINT, params=params)
+        params = {
+            key: value
+            for key, value in (
+                ("firstname", firstname),
+                ("lastname", lastname),
+                ("checkin", checkin),
+                ("checkout", checkout),
+            )
+            if value
+        }
+        return self.get(self.ENDPOINT, params=params or None)
 
     def get_booking(self, booking_id: int) -> requests.Response:
         """Get a specific booking by ID."""
@@ -106,6 +133,18 @@ class BookingService(BaseAPIClient):
         """
         return self.post(self.ENDPOINT, json=booking.to_dict())
 
+    def create_booking_raw(self, body: bytes) -> requests.Response:
+        """
+        Create a new booking from a pre-serialized JSON body.
+
+        Skips building a Booking model; pair with
+        `utils.test_data.create_valid_booking_bytes`.
+
+        Args:
+            body: JSON-encoded booking payload.
+        """
+        return self.post_raw(self.ENDPOINT, body)
+
     def update_booking(
         self, booking_id: int, booking: Booking
     ) -> requests.Response:
@@ -149,3 +188,9 @@ class BookingService(BaseAPIClient):
             f"{self.ENDPOINT}/{booking_id}",
             headers=self.auth_headers,
         )
+
+    # ── Health Check ────────────────────────────────────────────
+
+    def ping(self) -> requests.Response:
+        """Check that the API is up."""
+        return self.get(self.PING_ENDPOINT)
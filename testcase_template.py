@@ -13,23 +13,33 @@ How to use this template:
     5. Delete this header comment block
 
 Available fixtures (add as method arguments — no setup required):
-    booking_service  — pre-configured BookingService client (session-scoped)
-    auth_token       — authentication token string
-    sample_booking   — a valid Booking model instance
-    created_booking  — a booking already created in the API (returns dict with 'id' and 'data')
+    booking_service         — pre-configured BookingService client (session-scoped)
+    auth_token              — authentication token string
+    sample_booking          — a valid Booking model instance (session-scoped, read-only)
+    shared_created_booking  — a booking created once per module; do not modify it
+                              (returns dict with 'id' and 'data')
+    created_booking         — a fresh booking per test, safe to update
+                              (returns dict with 'id' and 'data')
 
 Available validators (import from utils.validators):
     assert_status_code(response, expected_code)
     assert_json_key_exists(response, key)
     assert_json_value(response, key, expected_value)
+    assert_json_type(response, key, expected_type)
     assert_booking_fields(booking_data, expected_dict)
+    make_booking_field_checker(expected_dict) — reusable booking_data check for many bookings
     assert_response_time(response, max_seconds)
     assert_json_list_not_empty(response)
     assert_content_type(response, expected_type)
+    validate(response, status=..., content_type=..., max_time=...,
+             json_schema={key: type}, json_equals={key: value})
+                                       — run several checks in one call
 
 Available test data helpers (import from utils.test_data):
     create_valid_booking(**overrides)   — returns a Booking with sensible defaults
     create_booking_payload(**overrides) — returns a raw dict payload
+    create_valid_booking_bytes(**overrides) — returns the payload as JSON bytes
+                                           (send with booking_service.create_booking_raw)
 """
 
 import logging
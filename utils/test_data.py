@@ -5,8 +5,27 @@ Provides reusable functions to create valid and invalid test payloads,
 keeping test files clean and focused on assertions.
 """
 
+import orjson
+
 from models.booking import Booking, BookingDates
 
+_DEFAULT_DATES = BookingDates(checkin="2025-01-01", checkout="2025-01-10")
+
+_DEFAULTS = {
+    "firstname": "John",
+    "lastname": "Doe",
+    "totalprice": 150,
+    "depositpaid": True,
+    "bookingdates": _DEFAULT_DATES,
+    "additionalneeds": "Breakfast",
+}
+
+# orjson serializes the BookingDates dataclass as a plain object
+_TEMPLATE_BYTES = orjson.dumps(_DEFAULTS)
+
+_DATE_FIELDS = frozenset(("checkin", "checkout"))
+_MISSING = object()
+
 
 def create_valid_booking(**overrides) -> Booking:
     """
@@ -17,26 +36,76 @@ def create_valid_booking(**overrides) -> Booking:
     Returns:
         A Booking instance with valid test data.
     """
-    defaults = {
-        "firstname": "John",
-        "lastname": "Doe",
-        "totalprice": 150,
-        "depositpaid": True,
-        "bookingdates": BookingDates(
-            checkin="2025-01-01",
-            checkout="2025-01-10",
-        ),
-        "additionalneeds": "Breakfast",
-    }
-    defaults.update(overrides)
-
-    # Handle bookingdates if passed as a dict
-    if isinstance(defaults["bookingdates"], dict):
-        defaults["bookingdates"] = BookingDates(**defaults["bookingdates"])
+    if not overrides:
+        return Booking(**_DEFAULTS)
+
+    defaults = {**_DEFAULTS, **overrides}
+
+    # Handle bookingdates if passed as a dict (the defaults never are)
+    if "bookingdates" in overrides:
+        bookingdates = overrides["bookingdates"]
+        if bookingdates is None:
+            raise TypeError("bookingdates must be a BookingDates or a dict, not None")
+        if isinstance(bookingdates, dict):
+            defaults["bookingdates"] = BookingDates(**bookingdates)
 
     return Booking(**defaults)
 
 
+# Module-private template; create_booking_payload() only ever hands out copies
+_DEFAULT_PAYLOAD = create_valid_booking().to_dict()
+_DEFAULT_DATES_PAYLOAD = _DEFAULT_PAYLOAD["bookingdates"]
+
+
 def create_booking_payload(**overrides) -> dict:
-    """Create a valid booking payload as a dictionary."""
-    return create_valid_booking(**overrides).to_dict()
+    """
+    Create a valid booking payload as a dictionary.
+
+    Copies the prebuilt default payload and patches in the overrides,
+    without building Booking/BookingDates models. `bookingdates` may be
+    a BookingDates or a dict of the dates to change; unknown fields,
+    unknown date keys and `bookingdates=None` raise TypeError.
+    """
+    unknown = overrides.keys() - _DEFAULTS.keys()
+    if unknown:
+        raise TypeError(f"Unexpected booking field(s): {', '.join(sorted(unknown))}")
+
+    payload = _DEFAULT_PAYLOAD.copy()
+    bookingdates = overrides.pop("bookingdates", _MISSING)
+    if overrides:
+        payload.update(overrides)
+        # Match Booking.to_dict(), which omits unset additionalneeds
+        if payload.get("additionalneeds", "") is None:
+            del payload["additionalneeds"]
+
+    if bookingdates is _MISSING:
+        payload["bookingdates"] = _DEFAULT_DATES_PAYLOAD.copy()
+    elif bookingdates is None:
+        raise TypeError("bookingdates must be a BookingDates or a dict, not None")
+    elif isinstance(bookingdates, dict):
+        unknown = bookingdates.keys() - _DATE_FIELDS
+        if unknown:
+            raise TypeError(
+                f"Unexpected bookingdates field(s): {', '.join(sorted(unknown))}"
+            )
+        payload["bookingdates"] = {**_DEFAULT_DATES_PAYLOAD, **bookingdates}
+    else:
+        payload["bookingdates"] = {
+            "checkin": bookingdates.checkin,
+            "checkout": bookingdates.checkout,
+        }
+    return payload
+
+
+def create_valid_booking_bytes(**overrides) -> bytes:
+    """
+    Create a valid booking payload as serialized JSON bytes.
+
+    Accepts the same overrides as `create_booking_payload` (unknown
+    fields and date keys raise TypeError, partial bookingdates are
+    merged with the defaults), but returns bytes ready for
+    `BookingService.create_booking_raw`.
+    """
+    if not overrides:
+        return _TEMPLATE_BYTES
+    return orjson.dumps(create_booking_payload(**overrides))
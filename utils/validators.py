@@ -3,77 +3,251 @@ Response validators - Reusable assertion helpers for API tests.
 
 Centralizes common validation patterns so tests are concise
 and validation logic is consistent across the suite.
+
+Checks raise AssertionError explicitly rather than using `assert`,
+so they still run when Python is started with -O.
 """
 
 import logging
+import operator
+from datetime import timedelta
+from typing import TYPE_CHECKING
 
-import requests
+if TYPE_CHECKING:
+    import requests
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# max_seconds -> timedelta, so repeated thresholds (e.g. 5.0) are built once
+_MAX_CACHE: dict[float, timedelta] = {}
+
+
+def _json(response: "requests.Response"):
+    """
+    Return the parsed JSON body, parsing it at most once per response.
+
+    The result is memoized on the response object, so validators
+    called one after another on the same response share one parse.
+    """
+    data = response.__dict__.get("_cached_json", _MISSING)
+    if data is _MISSING:
+        data = response.json()
+        response.__dict__["_cached_json"] = data
+    return data
+
+
+def _content_type(response: "requests.Response") -> str:
+    """
+    Return the Content-Type header, looking it up at most once per response.
+
+    Memoized on the response object like `_json`, so repeated content
+    type checks skip the case-insensitive header lookup.
+    """
+    content_type = response.__dict__.get("_ct_cache")
+    if content_type is None:
+        content_type = response.headers.get("Content-Type", "")
+        response.__dict__["_ct_cache"] = content_type
+    return content_type
+
+
+def _body_preview(response: "requests.Response", limit: int = 300) -> str:
+    """
+    Return the start of the response body for failure messages.
+
+    Slices the raw bytes before decoding, so a large body is never
+    decoded in full just to show its first few hundred characters.
+    """
+    return response.content[:limit].decode("utf-8", "replace")
+
 
-def assert_status_code(response: requests.Response, expected: int):
+def assert_status_code(response: "requests.Response", expected: int):
     """Assert the response has the expected status code."""
-    assert response.status_code == expected, (
-        f"Expected status {expected}, got {response.status_code}. "
-        f"Response: {response.text[:300]}"
-    )
+    if response.status_code != expected:
+        raise AssertionError(
+            f"Expected status {expected}, got {response.status_code}. "
+            f"Response: {_body_preview(response)}"
+        )
 
 
-def assert_json_key_exists(response: requests.Response, key: str):
+def assert_json_key_exists(response: "requests.Response", key: str):
     """Assert a key exists in the JSON response."""
-    data = response.json()
-    assert key in data, f"Key '{key}' not found in response: {data}"
+    data = _json(response)
+    if key not in data:
+        raise AssertionError(f"Key '{key}' not found in response: {data}")
 
 
-def assert_json_value(response: requests.Response, key: str, expected_value):
+def assert_json_value(response: "requests.Response", key: str, expected_value):
     """Assert a specific key has the expected value in the JSON response."""
-    data = response.json()
-    assert key in data, f"Key '{key}' not found in response: {data}"
-    assert data[key] == expected_value, (
-        f"Expected '{key}' = {expected_value}, got {data[key]}"
-    )
+    data = _json(response)
+    if key not in data:
+        raise AssertionError(f"Key '{key}' not found in response: {data}")
+    if data[key] != expected_value:
+        raise AssertionError(
+            f"Expected '{key}' = {expected_value}, got {data[key]}"
+        )
+
+
+def assert_json_type(response: "requests.Response", key: str, expected_type: type):
+    """Assert a specific key in the JSON response has the expected type."""
+    data = _json(response)
+    if key not in data:
+        raise AssertionError(f"Key '{key}' not found in response: {data}")
+    if not isinstance(data[key], expected_type):
+        raise AssertionError(
+            f"Expected '{key}' to be {expected_type.__name__}, "
+            f"got {type(data[key]).__name__}"
+        )
 
 
 def assert_booking_fields(booking_data: dict, expected: dict):
     """
     Assert that booking data contains the expected field values.
 
+    All fields are compared in one pass and every mismatch is reported
+    together, rather than stopping at the first bad field.
+
     Args:
         booking_data: The booking dictionary from the API response.
         expected: Dictionary of expected field values.
     """
+    mismatches = []
     for key, value in expected.items():
         if key == "bookingdates":
-            for date_key, date_val in value.items():
-                assert booking_data["bookingdates"][date_key] == date_val, (
-                    f"Expected bookingdates.{date_key} = '{date_val}', "
-                    f"got '{booking_data['bookingdates'][date_key]}'"
-                )
-        else:
-            assert booking_data[key] == value, (
-                f"Expected '{key}' = '{value}', got '{booking_data[key]}'"
+            continue
+        actual = booking_data.get(key, _MISSING)
+        if actual != value:
+            mismatches.append((key, value, actual))
+
+    expected_dates = expected.get("bookingdates")
+    if expected_dates is not None:
+        actual_dates = booking_data.get("bookingdates", _MISSING)
+        if not isinstance(actual_dates, dict):
+            mismatches.append(("bookingdates", expected_dates, actual_dates))
+        elif not expected_dates.items() <= actual_dates.items():
+            for date_key, date_val in expected_dates.items():
+                actual_date = actual_dates.get(date_key, _MISSING)
+                if actual_date != date_val:
+                    mismatches.append(
+                        (f"bookingdates.{date_key}", date_val, actual_date)
+                    )
+
+    if mismatches:
+        lines = []
+        for key, value, actual in mismatches:
+            shown = "<missing>" if actual is _MISSING else repr(actual)
+            lines.append(f"  Expected '{key}' = {value!r}, got {shown}")
+        details = "\n".join(lines)
+        raise AssertionError(f"Booking fields do not match:\n{details}")
+
+
+def make_booking_field_checker(expected: dict):
+    """
+    Build a reusable `assert_booking_fields` check for many bookings.
+
+    The expected values are compiled once into an `itemgetter` and a
+    tuple, so checking each booking is a single tuple comparison plus
+    a bookingdates subset test. On a mismatch the full per-field
+    report from `assert_booking_fields` is raised.
+
+    Args:
+        expected: Dictionary of expected field values.
+
+    Returns:
+        A callable taking the booking dictionary to check.
+    """
+    expected = dict(expected)
+    keys = tuple(key for key in expected if key != "bookingdates")
+    getter = operator.itemgetter(*keys) if keys else None
+    expected_values = getter(expected) if getter else None
+    expected_dates = expected.get("bookingdates")
+    date_items = expected_dates.items() if expected_dates is not None else None
+
+    def check(booking_data: dict):
+        try:
+            matches = (
+                getter is None or getter(booking_data) == expected_values
+            ) and (
+                date_items is None
+                or date_items <= booking_data["bookingdates"].items()
             )
+        except (KeyError, AttributeError, TypeError):
+            matches = False
+        if not matches:
+            assert_booking_fields(booking_data, expected)
 
+    return check
 
-def assert_response_time(response: requests.Response, max_seconds: float = 5.0):
+
+def _threshold(max_seconds: float) -> timedelta:
+    """Return `max_seconds` as a cached timedelta for direct comparison."""
+    threshold = _MAX_CACHE.get(max_seconds)
+    if threshold is None:
+        threshold = _MAX_CACHE.setdefault(max_seconds, timedelta(seconds=max_seconds))
+    return threshold
+
+
+def assert_response_time(response: "requests.Response", max_seconds: float = 5.0):
     """Assert the response was received within an acceptable time."""
-    elapsed = response.elapsed.total_seconds()
-    assert elapsed < max_seconds, (
-        f"Response took {elapsed:.2f}s, exceeding {max_seconds}s threshold"
-    )
+    elapsed = response.elapsed
+    if elapsed >= _threshold(max_seconds):
+        raise AssertionError(
+            f"Response took {elapsed.total_seconds():.2f}s, "
+            f"exceeding {max_seconds}s threshold"
+        )
 
 
-def assert_json_list_not_empty(response: requests.Response):
+def assert_json_list_not_empty(response: "requests.Response"):
     """Assert the JSON response is a non-empty list."""
-    data = response.json()
-    assert isinstance(data, list), f"Expected a list, got {type(data).__name__}"
-    assert len(data) > 0, "Expected non-empty list, got empty"
+    data = _json(response)
+    # JSON decoding only ever produces plain lists, never subclasses
+    if type(data) is not list:
+        raise AssertionError(f"Expected a list, got {type(data).__name__}")
+    if not data:
+        raise AssertionError("Expected non-empty list, got empty")
 
 
-def assert_content_type(response: requests.Response, expected: str = "application/json"):
+def assert_content_type(response: "requests.Response", expected: str = "application/json"):
     """Assert the response Content-Type header."""
-    content_type = response.headers.get("Content-Type", "")
-    assert expected in content_type, (
-        f"Expected Content-Type '{expected}', got '{content_type}'"
-    )
+    content_type = _content_type(response)
+    if expected not in content_type:
+        raise AssertionError(
+            f"Expected Content-Type '{expected}', got '{content_type}'"
+        )
+
+
+def validate(
+    response: "requests.Response",
+    *,
+    status: int = None,
+    content_type: str = None,
+    max_time: float = None,
+    json_schema: dict = None,
+    json_equals: dict = None,
+):
+    """
+    Run several response checks in a single call.
+
+    Delegates to the individual assert_* helpers; the JSON body and
+    Content-Type header are memoized on the response, so they are
+    read only once however many checks use them. Only the checks
+    whose argument is given are run.
+
+    Args:
+        status: Expected HTTP status code.
+        content_type: Substring expected in the Content-Type header.
+        max_time: Maximum acceptable response time in seconds.
+        json_schema: Mapping of JSON key to its expected type.
+        json_equals: Mapping of JSON key to its expected value.
+    """
+    if status is not None:
+        assert_status_code(response, status)
+    if content_type is not None:
+        assert_content_type(response, content_type)
+    if max_time is not None:
+        assert_response_time(response, max_time)
+    for key, expected_type in (json_schema or {}).items():
+        assert_json_type(response, key, expected_type)
+    for key, expected_value in (json_equals or {}).items():
+        assert_json_value(response, key, expected_value)